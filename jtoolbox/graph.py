@@ -24,10 +24,15 @@ class TickRedrawer(matplotlib.artist.Artist):
         for axis in (self.axes.xaxis, self.axes.yaxis):
             loc_min, loc_max = axis.get_view_interval()
 
-            for tick in axis.get_major_ticks() + axis.get_minor_ticks():
-                if tick.get_visible() and loc_min <= tick.get_loc() <= loc_max:
-                    for artist in (tick.tick1line, tick.tick2line):
-                        artist.draw(renderer)
+            ticks = axis.get_major_ticks() + axis.get_minor_ticks()
+            # filter by location in one pass; unset locations become nan and are dropped
+            locs = np.asarray([tick.get_loc() for tick in ticks], dtype=np.float64)
+            in_view = ((locs >= loc_min) & (locs <= loc_max)).tolist()
+
+            for tick, keep in zip(ticks, in_view):
+                if keep and tick.get_visible():
+                    tick.tick1line.draw(renderer)
+                    tick.tick2line.draw(renderer)
 
         renderer.close_group(self.__name__)
         self.stale = False